@@ -4,24 +4,63 @@ Bus Stop Display - Real-time bus tracking for OLED display
 Fetches bus data from UK Bus Open Data API and displays on SSD1322 OLED
 """
 
+import asyncio
+
+import aiohttp
+import numpy as np
 import requests
-import xml.etree.ElementTree as ET
-from math import radians, sin, cos, sqrt, atan2
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from math import radians, degrees, sin, cos, sqrt, atan2
 from typing import Optional, List, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+import signal
 import time
-import random
 from datetime import datetime, timedelta, timezone
 from luma.core.interface.serial import spi
 from luma.oled.device import ssd1322
-from luma.core.render import canvas
-from PIL import ImageFont
+from PIL import Image, ImageDraw, ImageFont
+
+# Optional numba acceleration for the distance/bearing kernel - worthwhile on
+# a Pi where NumPy may be slow or absent, but never required
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # API Configuration
 API_BASE_URL = "https://data.bus-data.dft.gov.uk/api/v1/datafeed/"
 API_KEY = "" # PUT YOUR API KEY HERE
 
+# Shared HTTP session with a connection pool so keep-alive sockets (and their
+# TLS handshakes) are reused across routes and across poll cycles
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# SIRI XML tag constants - extraction is a single linear pass over each
+# journey's children driven by the tag -> Bus field table below, instead of
+# one tree query per field
+SIRI = '{http://www.siri.org.uk/siri}'
+VEHICLE_ACTIVITY_TAG = SIRI + 'VehicleActivity'
+JOURNEY_TAG = SIRI + 'MonitoredVehicleJourney'
+VEHICLE_LOCATION_TAG = SIRI + 'VehicleLocation'
+LONGITUDE_TAG = SIRI + 'Longitude'
+LATITUDE_TAG = SIRI + 'Latitude'
+RECORDED_AT_TAG = SIRI + 'RecordedAtTime'
+
+TAG_TO_FIELD = {
+    SIRI + 'LineRef': 'line_ref',
+    SIRI + 'OperatorRef': 'operator_ref',
+    SIRI + 'OriginRef': 'origin_ref',
+    SIRI + 'DestinationRef': 'destination_ref',
+    SIRI + 'VehicleRef': 'vehicle_ref',
+    SIRI + 'OriginName': 'origin_name',
+    SIRI + 'DestinationName': 'destination_name',
+}
+
 # Bus Stop Location
 BUS_STOP_LATITUDE = # PUT YOUR STOP LATITUDE HERE
 BUS_STOP_LONGITUDE = # PUT YOUR STOP LONGITUDE HERE (Be sure to get these the right way around)
@@ -37,14 +76,14 @@ BUS_ROUTES = [
     ("AKSS", "1", "249000000619", "249000000700") # e.g Arriva Kent and Surrey, Route 1, Gillingham The Strand (NW-bound) to Chatham Railway Station (Stop B)
 ]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Location:
     """Represents a geographic location with latitude and longitude"""
     latitude: float
     longitude: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Bus:
     """Represents a bus with its current location and details"""
     line_ref: str
@@ -68,16 +107,29 @@ class Bus:
         return calculate_distance(self.location, target)
 
 
-@dataclass
+@dataclass(slots=True)
 class BusStop:
     """Represents a bus stop with its location"""
     name: str
     stop_ref: str
     location: Location
-    
+    # Cached stop-side trig, filled in by __post_init__
+    _lat_rad: float = field(init=False, repr=False)
+    _lon_rad: float = field(init=False, repr=False)
+    _cos_lat: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Cache the stop-side trig once - the stop never moves, so there is
+        # no point redoing radians/sin/cos for it on every bus
+        self._lat_rad = radians(self.location.latitude)
+        self._lon_rad = radians(self.location.longitude)
+        self._cos_lat = cos(self._lat_rad)
+
     def distance_from_bus(self, bus: Bus) -> float:
         """Calculate distance from this stop to a bus in meters"""
-        return bus.distance_to(self.location)
+        if bus.location is None:
+            return float('inf')
+        return distance_from_stop(self, bus.location)
 
 
 def calculate_distance(loc1: Location, loc2: Location) -> float:
@@ -130,11 +182,141 @@ def calculate_bearing(from_loc: Location, to_loc: Location) -> float:
     y = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dlon)
     
     bearing = atan2(x, y)
-    bearing = (bearing * 180 / 3.14159265359 + 360) % 360
-    
+    bearing = (degrees(bearing) + 360) % 360
+
     return bearing
 
 
+def distance_from_stop(stop: BusStop, bus_location: Location) -> float:
+    """
+    Calculate distance from a stop to a bus location in meters
+    Specialized Haversine that reuses the trig constants cached on the stop,
+    halving the per-bus trig work
+
+    Args:
+        stop: BusStop (with cached stop-side trig)
+        bus_location: Location of the bus
+
+    Returns:
+        Distance in meters
+    """
+    # Earth's radius in meters
+    R = 6371000
+
+    lat2 = radians(bus_location.latitude)
+    lon2 = radians(bus_location.longitude)
+
+    dlat = lat2 - stop._lat_rad
+    dlon = lon2 - stop._lon_rad
+
+    a = sin(dlat / 2)**2 + stop._cos_lat * cos(lat2) * sin(dlon / 2)**2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+
+    return R * c
+
+
+def _haversine_bearing_kernel(lat2, lon2, stop_lat, stop_lon):
+    """
+    Core Haversine distance and bearing math over radian arrays
+    Written in njit-compatible NumPy so numba can compile it when present
+
+    Args:
+        lat2: NumPy array of bus latitudes in radians
+        lon2: NumPy array of bus longitudes in radians
+        stop_lat: Stop latitude in radians
+        stop_lon: Stop longitude in radians
+
+    Returns:
+        Tuple of (distances, bearings) NumPy arrays
+    """
+    # Earth's radius in meters
+    R = 6371000
+
+    dlat = lat2 - stop_lat
+    dlon = lon2 - stop_lon
+
+    sin_lat1, cos_lat1 = np.sin(stop_lat), np.cos(stop_lat)
+    sin_lat2, cos_lat2 = np.sin(lat2), np.cos(lat2)
+
+    # Haversine formula
+    a = np.sin(dlat / 2)**2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2)**2
+    distances = R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    # Bearing from the stop to each bus
+    x = np.sin(dlon) * cos_lat2
+    y = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * np.cos(dlon)
+    bearings = (np.degrees(np.arctan2(x, y)) + 360) % 360
+
+    return distances, bearings
+
+
+if njit is not None:
+    _haversine_bearing_kernel = njit(cache=True, fastmath=True)(_haversine_bearing_kernel)
+
+
+def haversine_bearing_vec(bus_lats, bus_lons, stop_lat: float, stop_lon: float):
+    """
+    Vectorized Haversine distance and bearing from a stop to many buses
+
+    Batches all the trig over NumPy arrays so the per-bus Python loop
+    (and its repeated radians/sin/cos calls) disappears; when numba is
+    installed the kernel is JIT-compiled on top of that
+
+    Args:
+        bus_lats: Array-like of bus latitudes in degrees
+        bus_lons: Array-like of bus longitudes in degrees
+        stop_lat: Stop latitude in degrees
+        stop_lon: Stop longitude in degrees
+
+    Returns:
+        Tuple of (distances, bearings) NumPy arrays - distances in meters,
+        bearings in degrees (0-360) measured from the stop to each bus
+    """
+    lat2 = np.radians(np.asarray(bus_lats, dtype=np.float64))
+    lon2 = np.radians(np.asarray(bus_lons, dtype=np.float64))
+
+    return _haversine_bearing_kernel(lat2, lon2, radians(stop_lat), radians(stop_lon))
+
+
+def direction_filter_mask(dx, dy, filter_direction: str):
+    """
+    Build a boolean mask of buses that are in the filtered direction
+    Vectorized counterpart of is_in_filtered_direction, working on the same
+    east/north displacement sign tests
+
+    Args:
+        dx: NumPy array of eastward displacements from the stop
+        dy: NumPy array of northward displacements from the stop
+        filter_direction: Cardinal direction to filter (N, E, S, W)
+
+    Returns:
+        Boolean NumPy array - True where the bus should be excluded
+    """
+    if not filter_direction:
+        return np.zeros(len(dx), dtype=bool)
+
+    filter_dir = filter_direction.upper()
+
+    if filter_dir == "N":
+        return dy > 0
+    elif filter_dir == "E":
+        return dx > 0
+    elif filter_dir == "S":
+        return dy < 0
+    elif filter_dir == "W":
+        return dx < 0
+    elif filter_dir == "NE":
+        return (dx > 0) & (dy > 0)
+    elif filter_dir == "SE":
+        return (dx > 0) & (dy < 0)
+    elif filter_dir == "SW":
+        return (dx < 0) & (dy < 0)
+    elif filter_dir == "NW":
+        return (dx < 0) & (dy > 0)
+
+    return np.zeros(len(dx), dtype=bool)
+
+
 def get_cardinal_direction(bearing: float) -> str:
     """
     Convert bearing to cardinal direction
@@ -150,77 +332,97 @@ def get_cardinal_direction(bearing: float) -> str:
     return directions[index]
 
 
-def is_in_filtered_direction(bus_location: Location, stop_location: Location, filter_direction: str) -> bool:
+def is_in_filtered_direction(bus_location: Location, stop: BusStop, filter_direction: str) -> bool:
     """
     Check if a bus is in the filtered direction relative to the stop
-    Uses broader ranges: N filters 315-45°, E filters 45-135°, S filters 135-225°, W filters 225-315°
-    
+    Cardinal filters match the whole half-plane (N covers 270-90°, E covers
+    0-180°, and so on); diagonal filters match their quadrant
+
+    Tests the sign of the bus's local east/north displacement from the stop
+    instead of computing a full bearing - one subtraction and a compare per
+    axis, no trig
+
     Args:
         bus_location: Location of the bus
-        stop_location: Location of the bus stop
+        stop: BusStop the bus is relative to
         filter_direction: Cardinal direction to filter (N, E, S, W)
-    
+
     Returns:
         True if bus is in the filtered direction (should be excluded), False otherwise
     """
     if not filter_direction:
         return False
-    
-    # Calculate bearing from stop to bus
-    bearing = calculate_bearing(stop_location, bus_location)
-    
+
+    # Local equirectangular displacement: dx is east of the stop, dy is north
+    dx = (bus_location.longitude - stop.location.longitude) * stop._cos_lat
+    dy = bus_location.latitude - stop.location.latitude
+
     filter_dir = filter_direction.upper()
-    
-    # Define broader ranges for each cardinal direction
-    # N: 270° to 90° (includes NW, N, NE)
-    # E: 0° to 180° (includes NE, E, SE)
-    # S: 90° to 270° (includes SE, S, SW)
-    # W: 180° to 359° (includes SW, W, NW)
-    
+
     if filter_dir == "N":
-        return bearing >= 270 or bearing < 90
+        return dy > 0
     elif filter_dir == "E":
-        return 0 <= bearing < 180
+        return dx > 0
     elif filter_dir == "S":
-        return 90 <= bearing < 270
+        return dy < 0
     elif filter_dir == "W":
-        return 180 <= bearing <=359
-    else:
-        # If it's a diagonal direction (NE, SE, SW, NW), use narrower range
-        direction = get_cardinal_direction(bearing)
-        return direction == filter_dir
+        return dx < 0
+    elif filter_dir == "NE":
+        return dx > 0 and dy > 0
+    elif filter_dir == "SE":
+        return dx > 0 and dy < 0
+    elif filter_dir == "SW":
+        return dx < 0 and dy < 0
+    elif filter_dir == "NW":
+        return dx < 0 and dy > 0
 
+    return False
 
-def is_bus_data_fresh(recorded_at: str, max_age_minutes: int = 15) -> bool:
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(recorded_at: str) -> Optional[datetime]:
     """
-    Check if bus data is fresh (not older than max_age_minutes)
-    
+    Parse an ISO 8601 recorded-at string
+
+    Memoized on the raw string - vehicles repeat the same recorded_at across
+    polls, so steady-state parsing is a dict hit. Relies on Python 3.11+
+    fromisoformat accepting the trailing 'Z' directly
+
     Args:
         recorded_at: ISO 8601 timestamp string (e.g., "2025-12-05T09:46:52+00:00")
-        max_age_minutes: Maximum age in minutes (default 15)
-    
+
     Returns:
-        True if data is fresh, False if stale or invalid
+        Parsed datetime, or None if the string is missing or invalid
     """
     if not recorded_at:
-        return False
-    
+        return None
+
     try:
-        # Parse the ISO 8601 timestamp
-        recorded_time = datetime.fromisoformat(recorded_at.replace('Z', '+00:00'))
-        
-        # Get current time in UTC
-        current_time = datetime.now(timezone.utc)
-        
-        # Calculate age
-        age = current_time - recorded_time
-        
-        # Check if within acceptable age
-        return age <= timedelta(minutes=max_age_minutes)
+        return datetime.fromisoformat(recorded_at)
     except (ValueError, AttributeError) as e:
         print(f"Error parsing timestamp '{recorded_at}': {e}")
+        return None
+
+
+def is_bus_data_fresh(recorded_at: str, max_age_minutes: int = 15) -> bool:
+    """
+    Check if bus data is fresh (not older than max_age_minutes)
+
+    Args:
+        recorded_at: ISO 8601 timestamp string (e.g., "2025-12-05T09:46:52+00:00")
+        max_age_minutes: Maximum age in minutes (default 15)
+
+    Returns:
+        True if data is fresh, False if stale or invalid
+    """
+    recorded_time = _parse_timestamp(recorded_at)
+    if recorded_time is None:
         return False
 
+    # Check age against current UTC time
+    current_time = datetime.now(timezone.utc)
+    return current_time - recorded_time <= timedelta(minutes=max_age_minutes)
+
 
 def filter_buses_by_freshness(buses: List[Bus], max_age_minutes: int = 15) -> List[Bus]:
     """
@@ -233,11 +435,15 @@ def filter_buses_by_freshness(buses: List[Bus], max_age_minutes: int = 15) -> Li
     Returns:
         Filtered list of Bus objects with fresh data
     """
+    # One cutoff for the whole batch - no per-bus now()/timedelta work
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
+
     filtered = []
     for bus in buses:
-        if is_bus_data_fresh(bus.recorded_at, max_age_minutes):
+        recorded_time = _parse_timestamp(bus.recorded_at)
+        if recorded_time is not None and recorded_time >= cutoff:
             filtered.append(bus)
-    
+
     return filtered
 
 
@@ -260,23 +466,26 @@ def filter_buses_by_direction(buses: List[Bus], stop: BusStop, filter_direction:
     filtered = []
     for bus in buses:
         if bus.location:
-            if not is_in_filtered_direction(bus.location, stop.location, filter_direction):
+            if not is_in_filtered_direction(bus.location, stop, filter_direction):
                 filtered.append(bus)
     
     return filtered
 
 
-def fetch_bus_data(
+def fetch_and_parse_buses(
     operator_ref: str,
     line_ref: str,
     origin_ref: str,
     destination_ref: str,
     api_key: str = API_KEY,
     base_url: str = API_BASE_URL
-) -> Optional[str]:
+) -> Optional[List[Bus]]:
     """
-    Fetch bus data from the UK Bus Open Data API
-    
+    Fetch bus data from the UK Bus Open Data API and parse it on the fly
+
+    The response is streamed straight into the incremental XML parser, so
+    the payload is never held as a decoded string alongside the tree
+
     Args:
         operator_ref: Operator reference code (e.g., "AKSS")
         line_ref: Line/route reference (e.g., "7")
@@ -284,9 +493,9 @@ def fetch_bus_data(
         destination_ref: Destination stop reference
         api_key: API key for authentication
         base_url: Base URL for the API
-    
+
     Returns:
-        XML response as string, or None if request fails
+        List of Bus objects, or None if the request fails
     """
     params = {
         "api_key": api_key,
@@ -295,87 +504,107 @@ def fetch_bus_data(
         "originRef": origin_ref,
         "destinationRef": destination_ref
     }
-    
+
     try:
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.text
+        # (connect, read) timeouts - fail fast on an unreachable host rather
+        # than burning a full 10s of the poll budget
+        with SESSION.get(base_url, params=params, stream=True, timeout=(3, 5)) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any transfer encoding so the parser sees raw XML
+            response.raw.decode_content = True
+            return parse_buses_from_stream(response.raw)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching bus data: {e}")
         return None
 
 
-def parse_buses_from_xml(xml_data: str) -> List[Bus]:
+def _bus_from_activity(activity) -> Optional[Bus]:
     """
-    Parse bus data from SIRI XML response and create Bus objects
-    
+    Build a Bus from a single VehicleActivity element
+
+    Walks the journey's children once, routing each tag through TAG_TO_FIELD,
+    rather than issuing a separate tree query per field
+
     Args:
-        xml_data: XML response string from the API
-    
+        activity: lxml Element for a siri:VehicleActivity node
+
+    Returns:
+        Bus object, or None if the activity has no MonitoredVehicleJourney
+    """
+    journey = activity.find(JOURNEY_TAG)
+    if journey is None:
+        return None
+
+    kwargs = {
+        'line_ref': 'Unknown',
+        'operator_ref': 'Unknown',
+        'origin_ref': 'Unknown',
+        'destination_ref': 'Unknown',
+        'vehicle_ref': 'Unknown',
+        'origin_name': '',
+        'destination_name': '',
+    }
+    location = None
+
+    for child in journey:
+        field_name = TAG_TO_FIELD.get(child.tag)
+        if field_name is not None:
+            if child.text:
+                kwargs[field_name] = child.text
+        elif child.tag == VEHICLE_LOCATION_TAG:
+            # Extract location from the nested Longitude/Latitude pair
+            lon_text = lat_text = None
+            for coord in child:
+                if coord.tag == LONGITUDE_TAG:
+                    lon_text = coord.text
+                elif coord.tag == LATITUDE_TAG:
+                    lat_text = coord.text
+            if lon_text and lat_text:
+                try:
+                    location = Location(latitude=float(lat_text), longitude=float(lon_text))
+                except (ValueError, TypeError):
+                    pass
+
+    recorded_at = activity.find(RECORDED_AT_TAG)
+
+    return Bus(
+        recorded_at=recorded_at.text if recorded_at is not None and recorded_at.text else '',
+        location=location,
+        **kwargs
+    )
+
+
+def parse_buses_from_stream(stream) -> List[Bus]:
+    """
+    Parse bus data incrementally from a file-like object of SIRI XML
+
+    Streams VehicleActivity elements through iterparse and frees each one
+    after extraction, so the full document tree never materialises in memory
+
+    Args:
+        stream: Binary file-like object yielding the XML response
+
     Returns:
         List of Bus objects with location data
     """
     buses = []
-    
+
     try:
-        # Parse XML
-        root = ET.fromstring(xml_data)
-        
-        # Define namespace for SIRI XML
-        ns = {'siri': 'http://www.siri.org.uk/siri'}
-        
-        # Find all VehicleActivity elements
-        vehicle_activities = root.findall('.//siri:VehicleActivity', ns)
-        
-        for activity in vehicle_activities:
-            # Extract MonitoredVehicleJourney data
-            journey = activity.find('.//siri:MonitoredVehicleJourney', ns)
-            if journey is None:
-                continue
-            
-            # Extract location
-            location = None
-            vehicle_location = journey.find('.//siri:VehicleLocation', ns)
-            if vehicle_location is not None:
-                lon_elem = vehicle_location.find('siri:Longitude', ns)
-                lat_elem = vehicle_location.find('siri:Latitude', ns)
-                
-                if lon_elem is not None and lat_elem is not None:
-                    try:
-                        longitude = float(lon_elem.text)
-                        latitude = float(lat_elem.text)
-                        location = Location(latitude=latitude, longitude=longitude)
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Extract other details
-            line_ref = journey.find('siri:LineRef', ns)
-            operator_ref = journey.find('siri:OperatorRef', ns)
-            origin_ref = journey.find('siri:OriginRef', ns)
-            destination_ref = journey.find('siri:DestinationRef', ns)
-            vehicle_ref = journey.find('siri:VehicleRef', ns)
-            origin_name = journey.find('siri:OriginName', ns)
-            destination_name = journey.find('siri:DestinationName', ns)
-            recorded_at = activity.find('siri:RecordedAtTime', ns)
-            
-            bus = Bus(
-                line_ref=line_ref.text if line_ref is not None else 'Unknown',
-                operator_ref=operator_ref.text if operator_ref is not None else 'Unknown',
-                origin_ref=origin_ref.text if origin_ref is not None else 'Unknown',
-                destination_ref=destination_ref.text if destination_ref is not None else 'Unknown',
-                vehicle_ref=vehicle_ref.text if vehicle_ref is not None else 'Unknown',
-                origin_name=origin_name.text if origin_name is not None else '',
-                destination_name=destination_name.text if destination_name is not None else '',
-                recorded_at=recorded_at.text if recorded_at is not None else '',
-                location=location
-            )
-            buses.append(bus)
-            
-    except ET.ParseError as e:
+        for _, activity in etree.iterparse(stream, tag=VEHICLE_ACTIVITY_TAG):
+            bus = _bus_from_activity(activity)
+            if bus is not None:
+                buses.append(bus)
+
+            # Free the element and any already-processed siblings
+            activity.clear()
+            while activity.getprevious() is not None:
+                del activity.getparent()[0]
+
+    except etree.XMLSyntaxError as e:
         print(f"Error parsing XML: {e}")
     except Exception as e:
         print(f"Error processing bus data: {e}")
-    
+
     return buses
 
 
@@ -401,16 +630,27 @@ def display_bus_distances(buses: List[Bus], stop: BusStop, show_filtered: bool =
     
     print(f"\nFound {len(buses)} bus(es):\n")
     
-    # Sort buses by distance from stop
+    # Sort buses by distance from stop - exact distance and bearing for the
+    # whole batch in one vectorized (optionally JIT-compiled) kernel call
+    located_buses = [bus for bus in buses if bus.location]
     buses_with_distance = []
-    for bus in buses:
-        if bus.location:
-            distance = stop.distance_from_bus(bus)
-            bearing = calculate_bearing(stop.location, bus.location)
-            direction = get_cardinal_direction(bearing)
-            buses_with_distance.append((bus, distance, direction))
-    
-    buses_with_distance.sort(key=lambda x: x[1])
+    if located_buses:
+        lats = np.fromiter(
+            (bus.location.latitude for bus in located_buses),
+            dtype=np.float64, count=len(located_buses)
+        )
+        lons = np.fromiter(
+            (bus.location.longitude for bus in located_buses),
+            dtype=np.float64, count=len(located_buses)
+        )
+        distances, bearings = haversine_bearing_vec(
+            lats, lons, stop.location.latitude, stop.location.longitude
+        )
+        buses_with_distance = [
+            (bus, distances[i], get_cardinal_direction(bearings[i]))
+            for i, bus in enumerate(located_buses)
+        ]
+        buses_with_distance.sort(key=lambda x: x[1])
     
     for i, (bus, distance, direction) in enumerate(buses_with_distance, 1):
         print(f"Bus #{i} - Line {bus.line_ref} (Vehicle {bus.vehicle_ref})")
@@ -427,16 +667,14 @@ def test_with_sample_file():
     print("Testing with sample_output.xml...")
     
     try:
-        with open('sample_output.xml', 'r') as f:
-            xml_data = f.read()
-        
         stop = BusStop(
             name="My Bus Stop",
             stop_ref="2400A013900A",
             location=Location(latitude=BUS_STOP_LATITUDE, longitude=BUS_STOP_LONGITUDE)
         )
-        
-        buses = parse_buses_from_xml(xml_data)
+
+        with open('sample_output.xml', 'rb') as f:
+            buses = parse_buses_from_stream(f)
         
         # Apply freshness filter
         fresh_buses = filter_buses_by_freshness(buses, max_age_minutes=15)
@@ -454,208 +692,468 @@ def test_with_sample_file():
         print("sample_output.xml not found")
 
 
+# Per-route circuit breaker - a route that keeps failing gets skipped for an
+# exponentially growing interval (capped at 60s) so one degraded feed can't
+# burn its whole timeout on every poll. Reset on the first success
+_fail_counts: Dict[tuple, int] = {}
+_skip_until: Dict[tuple, float] = {}
+
+
+def _active_routes(routes: List[tuple], verbose: bool) -> List[tuple]:
+    """Filter out routes still inside their failure backoff window"""
+    now = time.monotonic()
+    active = []
+    for route in routes:
+        if now < _skip_until.get(route, 0):
+            if verbose:
+                print(f"Line {route[1]} ({route[0]}): skipped (backing off after failures)")
+        else:
+            active.append(route)
+    return active
+
+
+def _record_route_result(route: tuple, succeeded: bool):
+    """Update the per-route circuit breaker after a fetch attempt"""
+    if succeeded:
+        _fail_counts.pop(route, None)
+        _skip_until.pop(route, None)
+    else:
+        _fail_counts[route] = _fail_counts.get(route, 0) + 1
+        _skip_until[route] = time.monotonic() + min(60, 2 ** _fail_counts[route])
+
+
 def fetch_all_buses(routes: List[tuple], verbose: bool = True) -> List[Bus]:
     """
-    Fetch bus data for multiple routes and combine into a single list
-    
+    Fetch bus data for multiple routes in parallel and combine into a single list
+
+    Routes are fetched concurrently over the shared pooled session, so N routes
+    cost roughly one round-trip per poll instead of N. Routes in a failure
+    backoff window are skipped until it expires
+
     Args:
         routes: List of tuples (operator_ref, line_ref, origin_ref, destination_ref)
         verbose: Whether to print progress messages
-    
+
     Returns:
         Combined list of Bus objects from all routes
     """
     all_buses = []
-    
-    for operator_ref, line_ref, origin_ref, destination_ref in routes:
-        if verbose:
-            print(f"Fetching Line {line_ref} ({operator_ref})...")
-        
-        xml_data = fetch_bus_data(
-            operator_ref=operator_ref,
-            line_ref=line_ref,
-            origin_ref=origin_ref,
-            destination_ref=destination_ref
-        )
-        
-        if xml_data:
-            buses = parse_buses_from_xml(xml_data)
+
+    active_routes = _active_routes(routes, verbose)
+    if not active_routes:
+        return all_buses
+
+    with ThreadPoolExecutor(max_workers=min(8, len(active_routes))) as executor:
+        futures = {
+            executor.submit(fetch_and_parse_buses, *route): route
+            for route in active_routes
+        }
+
+        for future in as_completed(futures):
+            route = futures[future]
+            operator_ref, line_ref = route[0], route[1]
+            buses = future.result()
+
+            _record_route_result(route, buses is not None)
+            if buses is not None:
+                all_buses.extend(buses)
+                if verbose:
+                    print(f"Line {line_ref} ({operator_ref}): found {len(buses)} bus(es)")
+            else:
+                if verbose:
+                    print(f"Line {line_ref} ({operator_ref}): failed to fetch data")
+
+    return all_buses
+
+
+async def fetch_and_parse_buses_async(
+    session: "aiohttp.ClientSession",
+    operator_ref: str,
+    line_ref: str,
+    origin_ref: str,
+    destination_ref: str,
+    api_key: str = API_KEY,
+    base_url: str = API_BASE_URL
+) -> Optional[List[Bus]]:
+    """
+    Async counterpart of fetch_and_parse_buses using aiohttp
+
+    Response chunks are fed straight into an incremental XML parser as they
+    arrive, so parsing overlaps the network wait and the document never
+    materialises in full
+
+    Args:
+        session: Shared aiohttp ClientSession
+        operator_ref: Operator reference code (e.g., "AKSS")
+        line_ref: Line/route reference (e.g., "7")
+        origin_ref: Origin stop reference
+        destination_ref: Destination stop reference
+        api_key: API key for authentication
+        base_url: Base URL for the API
+
+    Returns:
+        List of Bus objects, or None if the request fails
+    """
+    params = {
+        "api_key": api_key,
+        "operatorRef": operator_ref,
+        "lineRef": line_ref,
+        "originRef": origin_ref,
+        "destinationRef": destination_ref
+    }
+
+    try:
+        async with session.get(base_url, params=params) as response:
+            response.raise_for_status()
+
+            buses = []
+            parser = etree.XMLPullParser(events=('end',), tag=VEHICLE_ACTIVITY_TAG)
+            async for chunk in response.content.iter_chunked(16384):
+                parser.feed(chunk)
+                for _, activity in parser.read_events():
+                    bus = _bus_from_activity(activity)
+                    if bus is not None:
+                        buses.append(bus)
+
+                    # Free the element and any already-processed siblings
+                    activity.clear()
+                    while activity.getprevious() is not None:
+                        del activity.getparent()[0]
+
+            return buses
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error fetching bus data: {e}")
+        return None
+    except etree.XMLSyntaxError as e:
+        print(f"Error parsing XML: {e}")
+        return None
+
+
+async def fetch_all_buses_async(
+    session: "aiohttp.ClientSession", routes: List[tuple], verbose: bool = True
+) -> List[Bus]:
+    """
+    Fetch bus data for multiple routes concurrently with aiohttp
+
+    Async counterpart of fetch_all_buses, sharing the same per-route
+    circuit breaker
+
+    Args:
+        session: Shared aiohttp ClientSession
+        routes: List of tuples (operator_ref, line_ref, origin_ref, destination_ref)
+        verbose: Whether to print progress messages
+
+    Returns:
+        Combined list of Bus objects from all routes
+    """
+    all_buses = []
+
+    active_routes = _active_routes(routes, verbose)
+    if not active_routes:
+        return all_buses
+
+    results = await asyncio.gather(
+        *(fetch_and_parse_buses_async(session, *route) for route in active_routes)
+    )
+
+    for route, buses in zip(active_routes, results):
+        _record_route_result(route, buses is not None)
+        if buses is not None:
             all_buses.extend(buses)
             if verbose:
-                print(f"  Found {len(buses)} bus(es)")
+                print(f"Line {route[1]} ({route[0]}): found {len(buses)} bus(es)")
         else:
             if verbose:
-                print(f"  Failed to fetch data")
-    
+                print(f"Line {route[1]} ({route[0]}): failed to fetch data")
+
     return all_buses
 
 
-def draw_bus_icon(draw, x, y, height=15):
+# Pre-rendered bus icons keyed by height - the icon is constant for a given
+# size, so it is drawn once and blitted instead of re-issuing the primitive
+# calls on every frame
+_BUS_ICON_CACHE: Dict[int, Image.Image] = {}
+
+
+def _render_bus_icon(height: int) -> Image.Image:
     """
-    Draw a simple bus icon using basic shapes
-    
+    Render the bus icon once into a 1-bit image for reuse as a stamp
+
     Args:
-        draw: PIL ImageDraw object
-        x, y: Top-left position
-        height: Height of the bus icon (default 15px)
+        height: Height of the bus icon in pixels
+
+    Returns:
+        1-bit PIL Image of the icon (set pixels are drawn white when blitted)
     """
     # Calculate proportional width (bus is roughly 1.5x height)
     width = int(height * 1.5)
-    
+
+    # Extra columns for the front bumper that pokes out past the body
+    icon = Image.new("1", (width + 2, height + 1))
+    draw = ImageDraw.Draw(icon)
+
     # Main bus body (rectangle)
     body_height = int(height * 0.7)
-    draw.rectangle((x, y, x + width, y + body_height), outline="white", fill="black")
-    
+    draw.rectangle((0, 0, width, body_height), outline=1, fill=0)
+
     # Windows (3 small rectangles)
     window_width = int(width * 0.22)
     window_height = int(body_height * 0.3)
-    window_y = y + 2
+    window_y = 2
     window_spacing = 1
-    
+
     # Left window
     draw.rectangle(
-        (x + 2, window_y, x + 2 + window_width, window_y + window_height),
-        outline="white",
-        fill="white"
+        (2, window_y, 2 + window_width, window_y + window_height),
+        outline=1,
+        fill=1
     )
-    
+
     # Middle window
-    middle_x = x + 2 + window_width + window_spacing
+    middle_x = 2 + window_width + window_spacing
     draw.rectangle(
         (middle_x, window_y, middle_x + window_width, window_y + window_height),
-        outline="white",
-        fill="white"
+        outline=1,
+        fill=1
     )
-    
+
     # Right window
     draw.rectangle(
-        (x + width - window_width - 2, window_y, x + width - 2, window_y + window_height),
-        outline="white",
-        fill="white"
+        (width - window_width - 2, window_y, width - 2, window_y + window_height),
+        outline=1,
+        fill=1
     )
-    
+
     # Wheels (2 circles, 50% larger)
     wheel_radius = int(height * 0.15 * 1.5)  # 50% larger
-    wheel_y = y + body_height - wheel_radius
-    
+    wheel_y = body_height - wheel_radius
+
     # Left wheel
     draw.ellipse(
-        (x + 3, wheel_y, x + 3 + wheel_radius * 2, wheel_y + wheel_radius * 2),
-        outline="white",
-        fill="black"
+        (3, wheel_y, 3 + wheel_radius * 2, wheel_y + wheel_radius * 2),
+        outline=1,
+        fill=0
     )
-    
+
     # Right wheel
     draw.ellipse(
-        (x + width - wheel_radius * 2 - 3, wheel_y, x + width - 3, wheel_y + wheel_radius * 2),
-        outline="white",
-        fill="black"
+        (width - wheel_radius * 2 - 3, wheel_y, width - 3, wheel_y + wheel_radius * 2),
+        outline=1,
+        fill=0
     )
-    
+
     # Front bumper (small rectangle)
     bumper_width = 1
     draw.rectangle(
-        (x + width, y + int(body_height * 0.3), x + width + bumper_width, y + int(body_height * 0.9)),
-        fill="white"
+        (width, int(body_height * 0.3), width + bumper_width, int(body_height * 0.9)),
+        fill=1
     )
 
+    return icon
+
 
-def draw_progress_bar(draw, x, y, width, height, progress, max_value=20.0):
+def draw_bus_icon(draw, x, y, height=15):
     """
-    Draw a progress bar showing distance (0-20km range)
-    
+    Stamp the bus icon at the given position
+
+    Blits a cached pre-rendered image rather than redrawing the
+    body/windows/wheels primitives each frame
+
     Args:
         draw: PIL ImageDraw object
         x, y: Top-left position
-        width, height: Dimensions of the bar
-        progress: Current value (distance in km)
-        max_value: Maximum value (default 20km)
+        height: Height of the bus icon (default 15px)
     """
-    # Clamp progress to 0-max_value range
-    progress = max(0, min(progress, max_value))
-    
-    # Calculate fill width (inverted - closer = more filled)
-    fill_ratio = 1.0 - (progress / max_value)
-    fill_width = int(width * fill_ratio)
-    
+    icon = _BUS_ICON_CACHE.get(height)
+    if icon is None:
+        icon = _render_bus_icon(height)
+        _BUS_ICON_CACHE[height] = icon
+
+    draw.bitmap((x, y), icon, fill="white")
+
+
+@lru_cache(maxsize=512)
+def render_text_bitmap(text: str) -> Image.Image:
+    """
+    Render a text string once into a minimal 1-bit image
+
+    The display labels repeat heavily across frames (distances are shown to
+    0.1km, line refs are fixed), so steady-state frames blit cached glyph
+    bitmaps instead of paying PIL's per-character layout cost every time
+
+    Args:
+        text: Text to render (default font)
+
+    Returns:
+        1-bit PIL Image of the rendered text
+    """
+    font = ImageFont.load_default()
+
+    # Render with headroom and crop to the actual ink - with FreeType default
+    # fonts (Pillow >= 10.1) glyphs can extend a few pixels past the advance
+    # width that font.getbbox reports, so sizing from the bbox clips the last
+    # glyph. Crop from the origin so the blit offset still matches draw.text
+    bbox = font.getbbox(text)
+    scratch = Image.new("1", (bbox[2] + 8, bbox[3] + 4))
+    ImageDraw.Draw(scratch).text((0, 0), text, font=font, fill=1)
+
+    ink = scratch.getbbox()
+    if ink is None:
+        return scratch.crop((0, 0, 1, 1))
+    return scratch.crop((0, 0, ink[2], ink[3]))
+
+
+def draw_text_cached(draw, xy, text: str):
+    """Blit a cached pre-rendered text bitmap at the given position"""
+    draw.bitmap(xy, render_text_bitmap(text), fill="white")
+
+
+# Fill widths for the fixed 80px / 0-20km progress bar, indexed by distance
+# in tenths of a km - precomputed so each frame is a table lookup instead of
+# clamp/ratio float arithmetic (inverted: closer = more filled)
+PROGRESS_BAR_WIDTH = 80
+PROGRESS_BAR_MAX_TENTHS = 200
+_FILL_WIDTHS = [
+    int(PROGRESS_BAR_WIDTH * (1 - k / PROGRESS_BAR_MAX_TENTHS))
+    for k in range(PROGRESS_BAR_MAX_TENTHS + 1)
+]
+
+
+def draw_progress_bar(draw, x, y, height, tenths_km: int):
+    """
+    Draw the progress bar for a distance given in tenths of a km (0-20km range)
+
+    Args:
+        draw: PIL ImageDraw object
+        x, y: Top-left position
+        height: Height of the bar
+        tenths_km: Distance in tenths of a km (clamped to the 20km range)
+    """
+    # Look up the fill width (inverted - closer = more filled)
+    fill_width = _FILL_WIDTHS[min(max(tenths_km, 0), PROGRESS_BAR_MAX_TENTHS)]
+
     # Draw outer border
-    draw.rectangle((x, y, x + width, y + height), outline="white", fill="black")
-    
+    draw.rectangle((x, y, x + PROGRESS_BAR_WIDTH, y + height), outline="white", fill="black")
+
     # Draw filled portion
     if fill_width > 0:
         draw.rectangle((x + 1, y + 1, x + fill_width - 1, y + height - 1), fill="white")
 
 
-def display_buses_on_oled(device, buses: List[Bus], stop: BusStop):
+# Persistent frame buffer, reused across refreshes so each frame repaints
+# only the dynamic regions instead of allocating a fresh canvas, plus a
+# signature of the last frame so unchanged frames skip the SPI push entirely
+_frame_image: Optional[Image.Image] = None
+_frame_draw = None
+_last_frame_sig = None
+
+
+def _get_frame(device):
+    """Return the persistent backing image and draw object for the device"""
+    global _frame_image, _frame_draw
+    if _frame_image is None or _frame_image.size != (device.width, device.height):
+        _frame_image = Image.new(device.mode, (device.width, device.height))
+        _frame_draw = ImageDraw.Draw(_frame_image)
+    return _frame_image, _frame_draw
+
+
+def display_buses_on_oled(device, buses_with_distance: List[tuple], stop: BusStop):
     """
     Display top 3 buses on OLED with progress bars and clock
-    
+
+    Draws into a persistent backing image rather than a fresh canvas per
+    frame, and skips the redraw and SPI push when nothing on screen changed
+
     Args:
         device: OLED device object
-        buses: List of Bus objects sorted by distance
+        buses_with_distance: List of (Bus, distance in meters) tuples sorted by distance
         stop: BusStop object
     """
-    with canvas(device) as draw:
-        # Get top 3 buses
-        top_buses = buses[:3]
-        
-        # Display each bus on a row (rows are smaller to fit clock at bottom)
-        for i, bus in enumerate(top_buses):
-            if bus.location:
-                distance_m = stop.distance_from_bus(bus)
-                distance_km = distance_m / 1000.0
-                
-                # Row position (15 pixels per row for 3 rows, leaving space for clock)
-                y = i * 15
-                
-                # Format: "1 [bus icon] 7    3.5km [progress bar]"
-                order_num = str(i + 1)
-                line_ref = bus.line_ref
-                distance_text = f"{distance_km:.1f}km away"
-                
-                # Draw order number
-                draw.text((2, y + 2), order_num, fill="white")
-                
-                # Draw bus icon
-                draw_bus_icon(draw, 15, y + 1, height=12)
-                
-                # Draw line reference (shifted right 20px more to make room for bus icon)
-                draw.text((55, y + 2), "#" + line_ref, fill="white")
-                
-                # Draw distance (shifted right 20px more)
-                draw.text((90, y + 2), distance_text, fill="white")
-                
-                # Determine what to show on the right side
-                if distance_m < 100:  # Less than 100 meters
-                    # Show "Arriving" text
-                    draw.text((device.width - 60, y + 2), "Arriving!", fill="white")
-                elif distance_km < 1.0:  # Less than 1km
-                    # Show "Leave now!" text
-                    draw.text((device.width - 70, y + 2), "Leave now!", fill="white")
-                else:
-                    # Draw progress bar (right side of screen)
-                    bar_x = device.width - 85
-                    bar_y = y + 2
-                    bar_width = 80
-                    bar_height = 10
-                    draw_progress_bar(draw, bar_x, bar_y, bar_width, bar_height, distance_km, max_value=20.0)
-        
-        # Always show time on bottom row
-        current_time = datetime.now().strftime("%H:%M:%S")
-        
-        # Calculate center position for time
-        # Approximate character width for default font
-        time_width = len(current_time) * 6
-        time_x = (device.width - time_width) // 2
-        time_y = 50  # Bottom of screen
-        
-        draw.text((time_x, time_y), current_time, fill="white")
+    global _last_frame_sig
+
+    image, draw = _get_frame(device)
+
+    # Get top 3 buses
+    top_buses = buses_with_distance[:3]
+    current_time = datetime.now().strftime("%H:%M:%S")
+
+    # Cheap change detection on what actually ends up on screen - distances
+    # matter at the 0.1km quantum the display shows
+    frame_sig = (
+        tuple(
+            (bus.vehicle_ref, bus.line_ref, round(distance_m / 100))
+            for bus, distance_m in top_buses if bus.location
+        ),
+        current_time,
+    )
+    if frame_sig == _last_frame_sig:
+        return
+    _last_frame_sig = frame_sig
+
+    # Repaint the dynamic regions: the bus rows and the clock line
+    draw.rectangle((0, 0, device.width - 1, 48), fill="black")
+    draw.rectangle((0, 50, device.width - 1, device.height - 1), fill="black")
+
+    # Display each bus on a row (rows are smaller to fit clock at bottom)
+    for i, (bus, distance_m) in enumerate(top_buses):
+        if bus.location:
+            distance_km = distance_m / 1000.0
+
+            # Row position (15 pixels per row for 3 rows, leaving space for clock)
+            y = i * 15
+
+            # Format: "1 [bus icon] 7    3.5km [progress bar]"
+            order_num = str(i + 1)
+            line_ref = bus.line_ref
+            distance_text = f"{distance_km:.1f}km away"
+
+            # Draw order number
+            draw_text_cached(draw, (2, y + 2), order_num)
+
+            # Draw bus icon
+            draw_bus_icon(draw, 15, y + 1, height=12)
+
+            # Draw line reference (shifted right 20px more to make room for bus icon)
+            draw_text_cached(draw, (55, y + 2), "#" + line_ref)
+
+            # Draw distance (shifted right 20px more)
+            draw_text_cached(draw, (90, y + 2), distance_text)
+
+            # Determine what to show on the right side
+            if distance_m < 100:  # Less than 100 meters
+                # Show "Arriving" text
+                draw_text_cached(draw, (device.width - 60, y + 2), "Arriving!")
+            elif distance_km < 1.0:  # Less than 1km
+                # Show "Leave now!" text
+                draw_text_cached(draw, (device.width - 70, y + 2), "Leave now!")
+            else:
+                # Draw progress bar (right side of screen)
+                bar_x = device.width - 85
+                bar_y = y + 2
+                bar_height = 10
+                draw_progress_bar(draw, bar_x, bar_y, bar_height, int(distance_km * 10))
+
+    # Always show time on bottom row
+    # Calculate center position for time
+    # Approximate character width for default font
+    time_width = len(current_time) * 6
+    time_x = (device.width - time_width) // 2
+    time_y = 50  # Bottom of screen
+
+    draw_text_cached(draw, (time_x, time_y), current_time)
+
+    device.display(image)
 
 
-def run_display_loop():
+async def run_display_loop():
     """
     Main loop to continuously fetch and display bus data on OLED
     Updates every 10 seconds with ±2 second jitter
+
+    Runs on asyncio: route fetches go through aiohttp concurrently, the next
+    poll's fetch is started before the current frame is rendered, and the
+    blocking PIL/SPI push happens in a worker thread so it never stalls an
+    in-flight fetch
     """
     # Initialize OLED display
     print("Initializing OLED display...")
@@ -664,7 +1162,15 @@ def run_display_loop():
 
     # Set contrast (0-255, default is ~127)
     device.contrast(32)  # Adjust this value to your preference, lower settings may reduce burn-in?
-    
+
+    # Clear the display in-process on shutdown - spawning clear_display.py
+    # from systemd re-opens the SPI device and repeats the whole SSD1322
+    # init sequence just to blank a screen we already hold open
+    def _handle_sigterm(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
     # Create bus stop
     stop = BusStop(
         name="My Bus Stop",
@@ -674,48 +1180,122 @@ def run_display_loop():
     
     print("Starting bus tracking loop...")
     print("Press Ctrl+C to exit")
-    
+
+    # Distance cache keyed on (vehicle_ref, recorded_at) - distance is
+    # deterministic for a fixed stop, so a vehicle whose position report
+    # hasn't changed since the last poll costs nothing. Rebuilt every poll
+    # so it only ever holds currently-reporting vehicles, and tied to this
+    # loop's stop so a different stop starts from an empty cache
+    geom_cache: Dict[tuple, float] = {}
+
+    async def sleep_then_fetch(session, delay):
+        """Wait out the remainder of the poll interval, then fetch all routes"""
+        await asyncio.sleep(delay)
+        return await fetch_all_buses_async(session, BUS_ROUTES, verbose=False)
+
+    timeout = aiohttp.ClientTimeout(sock_connect=3, sock_read=5)
+    connector = aiohttp.TCPConnector(limit=8)
+
     try:
-        while True:
-            # Fetch bus data
-            buses = fetch_all_buses(BUS_ROUTES, verbose=False)
-            
-            # Apply freshness filter (remove buses with stale data)
-            fresh_buses = filter_buses_by_freshness(buses, max_age_minutes=15)
-            
-            # Apply direction filter
-            filtered_buses = filter_buses_by_direction(fresh_buses, stop, CARDINAL_FILTER)
-            
-            # Sort by distance
-            buses_with_distance = []
-            for bus in filtered_buses:
-                if bus.location:
-                    distance = stop.distance_from_bus(bus)
-                    buses_with_distance.append((bus, distance))
-            
-            buses_with_distance.sort(key=lambda x: x[1])
-            sorted_buses = [bus for bus, _ in buses_with_distance]
-            
-            # Display on OLED
-            display_buses_on_oled(device, sorted_buses, stop)
-            
-            # Print summary to console
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Buses: {len(buses)} total, {len(fresh_buses)} fresh, {len(filtered_buses)} after direction filter, showing top {min(len(sorted_buses), 3)}")
-            
-            # List vehicle_ref for each tracked bus
-            if sorted_buses:
-                print("  Tracked buses:")
-                for i, bus in enumerate(sorted_buses[:3], 1):
-                    distance_km = stop.distance_from_bus(bus) / 1000.0
-                    print(f"    {i}. Line {bus.line_ref} - Vehicle {bus.vehicle_ref} - {distance_km:.1f}km away")
-            
-            # Wait with jitter (10 ± 2 seconds)
-            jitter = random.uniform(-2, 2)
-            sleep_time = 10 + jitter
-            time.sleep(sleep_time)
-            
-    except KeyboardInterrupt:
-        print("\nStopping display...")
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            # Poll against a monotonic deadline - sleeping the remainder to
+            # the next deadline instead of a flat interval stops per-iteration
+            # overhead from accumulating as drift
+            next_poll = time.monotonic()
+            fetch_task = asyncio.create_task(sleep_then_fetch(session, 0))
+
+            while True:
+                buses = await fetch_task
+
+                # Kick off the next cycle (sleep to the deadline, then fetch)
+                # straight away so the network wait overlaps the processing
+                # and rendering below. Jitter (±2s) comes from the low bits
+                # of the monotonic clock - no random module on the hot path
+                jitter = ((time.monotonic_ns() >> 10) & 0x3FFF) / 4096.0 - 2.0
+                next_poll += 10 + jitter
+                fetch_task = asyncio.create_task(
+                    sleep_then_fetch(session, max(0, next_poll - time.monotonic()))
+                )
+
+                # Single fused pass over the parsed buses: freshness check and
+                # location check together, no intermediate filtered lists
+                cutoff = datetime.now(timezone.utc) - timedelta(minutes=15)
+                fresh_count = 0
+                located_buses = []
+                for bus in buses:
+                    recorded_time = _parse_timestamp(bus.recorded_at)
+                    if recorded_time is None or recorded_time < cutoff:
+                        continue
+                    fresh_count += 1
+                    if bus.location:
+                        located_buses.append(bus)
+                sorted_buses = []
+                sorted_distances = []
+                if located_buses:
+                    lats = np.fromiter(
+                        (bus.location.latitude for bus in located_buses),
+                        dtype=np.float64, count=len(located_buses)
+                    )
+                    lons = np.fromiter(
+                        (bus.location.longitude for bus in located_buses),
+                        dtype=np.float64, count=len(located_buses)
+                    )
+
+                    # Local east/north displacements in radians - feed both the
+                    # direction sign tests and the equirectangular distance
+                    dx = np.radians(lons - stop.location.longitude) * stop._cos_lat
+                    dy = np.radians(lats - stop.location.latitude)
+
+                    # Reuse cached distances for vehicles whose position report
+                    # is unchanged; misses get the equirectangular
+                    # approximation, which is within 0.5% of Haversine at
+                    # sub-20km display range
+                    distances = np.empty(len(located_buses), dtype=np.float64)
+                    miss_indices = []
+                    for i, bus in enumerate(located_buses):
+                        cached = geom_cache.get((bus.vehicle_ref, bus.recorded_at))
+                        if cached is not None:
+                            distances[i] = cached
+                        else:
+                            miss_indices.append(i)
+
+                    if miss_indices:
+                        distances[miss_indices] = 6371000 * np.hypot(
+                            dx[miss_indices], dy[miss_indices]
+                        )
+
+                    # Keep only the vehicles seen this poll so the cache stays small
+                    geom_cache = {
+                        (bus.vehicle_ref, bus.recorded_at): distances[i]
+                        for i, bus in enumerate(located_buses)
+                    }
+
+                    # Apply direction filter, then sort by distance
+                    keep = ~direction_filter_mask(dx, dy, CARDINAL_FILTER)
+                    kept_buses = [bus for bus, k in zip(located_buses, keep) if k]
+                    kept_distances = distances[keep]
+                    order = np.argsort(kept_distances)
+                    sorted_buses = [kept_buses[i] for i in order]
+                    sorted_distances = kept_distances[order]
+
+                # Display on OLED, reusing the distances computed for the
+                # sort. The PIL drawing and SPI push block, so they run in a
+                # worker thread while the next fetch stays live
+                await asyncio.to_thread(
+                    display_buses_on_oled, device,
+                    list(zip(sorted_buses, sorted_distances)), stop
+                )
+
+                # Print summary to console
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Buses: {len(buses)} total, {fresh_count} fresh, {len(sorted_buses)} after direction filter, showing top {min(len(sorted_buses), 3)}")
+
+                # List vehicle_ref for each tracked bus
+                if sorted_buses:
+                    print("  Tracked buses:")
+                    for i, (bus, distance) in enumerate(zip(sorted_buses[:3], sorted_distances[:3]), 1):
+                        print(f"    {i}. Line {bus.line_ref} - Vehicle {bus.vehicle_ref} - {distance/1000.0:.1f}km away")
+
+    finally:
         device.clear()
         print("Display cleared. Goodbye!")
 
@@ -768,5 +1348,10 @@ if __name__ == "__main__":
             print("  python3 bus_stop.py --test   - Test with sample XML file")
             print("  python3 bus_stop.py --once   - Fetch and display once (console only)")
     else:
-        # Default: run continuous display loop
-        run_display_loop()
+        # Default: run continuous display loop. Ctrl+C is handled out here -
+        # asyncio.run cancels the coroutine and re-raises KeyboardInterrupt
+        # at its own call site, so an except inside the loop never fires
+        try:
+            asyncio.run(run_display_loop())
+        except KeyboardInterrupt:
+            print("\nStopping display...")
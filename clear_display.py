@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Clear the OLED display
-Used when stopping the service
+Manual fallback only - bus_stop.py clears the display itself on shutdown,
+so this is just for recovering a stuck screen without restarting the service
 """
 
 from luma.core.interface.serial import spi